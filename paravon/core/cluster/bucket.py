@@ -1,4 +1,5 @@
 import zlib
+from bisect import bisect_left, insort
 from paravon.core.models.membership import Membership
 from paravon.core.ports.serializer import Serializer
 
@@ -12,18 +13,32 @@ class Bucket:
     - a mapping of node_id → Membership
     - a checksum representing the serialized state of the bucket
     - a dirty flag indicating whether the checksum must be recomputed
+    - the serialized form of each membership, reused across recomputes
+      while the membership's version fields are unchanged
+
+    Memberships must be replaced through `add_or_update()` and dropped
+    through `remove()` to mark the bucket dirty. A membership updated in
+    place is re-serialized on the next recompute.
 
     Buckets are designed to be lightweight and deterministic. They do not
     implement any merge logic themselves; all conflict resolution is handled
     by the BucketTable.
     """
 
+    __slots__ = (
+        "bucket_id", "memberships", "checksum", "dirty",
+        "_serializer", "_blobs", "_order",
+    )
+
     def __init__(self, bucket_id: str, serializer: Serializer) -> None:
         self.bucket_id = bucket_id
         self._serializer = serializer
         self.memberships: dict[str, Membership] = {}
         self.checksum: int = 0
         self.dirty: bool = True
+        self._blobs: dict[str, tuple[tuple, bytes]] = {}
+        # node_ids kept in sorted order so recomputes need not sort
+        self._order: list[str] = []
 
     def add_or_update(self, membership: Membership) -> None:
         """
@@ -32,9 +47,30 @@ class Bucket:
         This operation marks the bucket as dirty so that the checksum will
         be recomputed on the next call to `get_checksum()`.
         """
-        self.memberships[membership.node_id] = membership
+        node_id = membership.node_id
+        if node_id not in self.memberships:
+            insort(self._order, node_id)
+        self.memberships[node_id] = membership
+        self._blobs.pop(node_id, None)
         self.dirty = True
 
+    def remove(self, node_id: str) -> Membership | None:
+        """
+        Remove a membership from the bucket, if present.
+
+        The bucket is marked dirty only when a membership was actually
+        removed.
+        """
+        membership = self.memberships.pop(node_id, None)
+        if membership is not None:
+            order = self._order
+            i = bisect_left(order, node_id)
+            if i < len(order) and order[i] == node_id:
+                del order[i]
+            self._blobs.pop(node_id, None)
+            self.dirty = True
+        return membership
+
     def get_checksum(self) -> int:
         """
         Return the current checksum of the bucket.
@@ -51,21 +87,70 @@ class Bucket:
         Recompute the checksum of the bucket.
 
         The checksum is computed by:
-        - sorting memberships by node_id for deterministic ordering
-        - serializing each membership
-        - feeding the serialized bytes into a CRC32 accumulator
+        - walking memberships in node_id order for deterministic ordering
+        - serializing each membership, reusing the bytes of members whose
+          version fields did not change since the last recompute
+        - computing a single CRC32 over the concatenated bytes
+
+        One crc32 call over the joined payload yields the same value as
+        chaining it per membership, but lets zlib work on one large buffer.
 
         This method updates the stored checksum and clears the dirty flag.
         """
-        items = sorted(self.memberships.values(), key=lambda m: m.node_id)
+        blobs = self._blobs
+        memberships = self.memberships
+        order = self._order
+        if len(order) != len(memberships):
+            self._resync_order()
+
+        serialize = self._serializer.serialize
+        parts = []
+        for node_id in order:
+            membership = memberships.get(node_id)
+            if membership is None:
+                # same size but different keys: the dict was edited directly
+                self._resync_order()
+                return self.recompute_checksum()
+            version = self._version_of(membership)
+            cached = blobs.get(node_id)
+            if cached is not None and cached[0] == version:
+                blob = cached[1]
+            else:
+                blob = serialize(membership.to_dict())
+                blobs[node_id] = (version, blob)
+            parts.append(blob)
+
+        payload = b"".join(parts)
+
+        self.checksum = zlib.crc32(payload)
+        self.dirty = False
 
-        crc = 0
-        for membership in items:
-            raw = self._serializer.serialize(membership.to_dict())
-            crc = zlib.crc32(raw, crc)
+    def _resync_order(self) -> None:
+        """
+        Rebuild the sorted node_ids after `memberships` was written to
+        directly rather than through `add_or_update()` / `remove()`.
+        """
+        memberships = self.memberships
+        self._order[:] = sorted(memberships)
+        for node_id in [n for n in self._blobs if n not in memberships]:
+            del self._blobs[node_id]
 
-        self.checksum = crc
-        self.dirty = False
+    @staticmethod
+    def _version_of(membership: Membership) -> tuple:
+        """
+        Return the fields a cached blob is checked against.
+
+        The local membership is updated in place, so every serialized
+        field is compared by value, tokens included.
+        """
+        return (
+            membership.epoch,
+            membership.incarnation,
+            membership.phase,
+            membership.size,
+            membership.peer_address,
+            tuple(membership.tokens),
+        )
 
     def serialize_memberships(self) -> dict[str, dict]:
         """
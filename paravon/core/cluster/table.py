@@ -100,10 +100,12 @@ class BucketTable:
         if not self._dirty_global and self._checksums_cache is not None:
             return self._checksums_cache
 
-        checksums = {}
-        for i in range(self._total_buckets):
-            idx = str(i)
-            checksums[idx] = self.buckets[idx].get_checksum()
+        # buckets were created in id order and each one only recomputes its
+        # own checksum when dirty, so clean buckets cost a cached read
+        checksums = {
+            bucket_id: bucket.get_checksum()
+            for bucket_id, bucket in self.buckets.items()
+        }
 
         self._checksums_cache = checksums
         self._dirty_global = False
@@ -172,7 +174,7 @@ class BucketTable:
             self._mark_dirty()
 
     def _delete_membership(self, bucket: Bucket, node_id: str) -> Membership | None:
-        local = bucket.memberships.pop(node_id, None)
+        local = bucket.remove(node_id)
         if local is not None:
             self._views.pop(node_id, None)
         return local
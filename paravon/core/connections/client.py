@@ -10,6 +10,17 @@ from paravon.core.models.message import Message
 from paravon.core.ports.serializer import Serializer
 
 
+# "!I" = uint32 big-endian (network order), precompiled once per process
+_HDR = struct.Struct("!I")
+
+
+class PeerConnectError(ConnectionError):
+    """
+    Raised when a connection to a peer could not be established after
+    exhausting the configured retries.
+    """
+
+
 class ClientConnection:
     """
     Maintains a persistent TCP connection to a remote peer and provides
@@ -131,7 +142,7 @@ class ClientConnection:
         try:
             while self.connected and not self._stopped:
                 header = await self._reader.readexactly(4)
-                length = struct.unpack("!I", header)[0]
+                length = _HDR.unpack(header)[0]
                 payload = await self._reader.readexactly(length)
                 data = self._serializer.deserialize(payload)
                 if not data:
@@ -162,13 +173,15 @@ class ClientConnection:
         if not self.connected:
             await self.connect()
             if not self.connected:
-                raise RuntimeError(f"Unable to connect to {self._address}")
+                raise PeerConnectError(f"Unable to connect to {self._address}")
 
         payload = self._serializer.serialize(message.to_dict())
-        frame = struct.pack("!I", len(payload)) + payload
+        header = _HDR.pack(len(payload))
 
         try:
-            self._writer.write(frame)
+            # header and payload are handed over separately to avoid
+            # copying the payload into a concatenated frame
+            self._writer.writelines((header, payload))
             await self._writer.drain()
         except ConnectionResetError as ex:
             self.connected = False
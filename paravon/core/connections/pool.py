@@ -4,7 +4,7 @@ import ssl
 from collections import defaultdict
 from typing import Callable
 
-from paravon.core.connections.client import ClientConnection
+from paravon.core.connections.client import ClientConnection, PeerConnectError
 from paravon.core.connections.handler import MessageHandler
 from paravon.core.helpers.spawn import TaskSpawner
 from paravon.core.helpers.sub import Subscription
@@ -13,6 +13,15 @@ from paravon.core.ports.serializer import Serializer
 from paravon.core.throttling.backoff import ExponentialBackoff
 
 
+class PeerUnavailableError(PeerConnectError):
+    """
+    Raised when a message targets a peer that recently failed to connect.
+
+    The pool keeps a peer in this state until its backoff window expires,
+    so callers fail immediately instead of waiting on a dead connection.
+    """
+
+
 class ClientConnectionPool:
     """
     Manages persistent TCP connections keyed by node_id and dispatches all
@@ -27,6 +36,19 @@ class ClientConnectionPool:
     executed asynchronously and independently to avoid blocking the dispatch
     pipeline.
 
+    A single SSLContext is held by the pool and handed to every connection
+    it creates, so TLS configuration is never rebuilt per peer.
+
+    When a peer cannot be reached (connection failure or reset), it is
+    marked down until a backoff window elapses. Sends issued inside that
+    window raise PeerUnavailableError without touching the connection,
+    which keeps tail latency bounded under partial network failures. The
+    first send after the window acts as a probe: success clears the state,
+    failure extends the window. Callers that send on a connection obtained
+    with `get()` (the prober, the gossiper) bypass this state; if they
+    reconnect the peer, the next `send()` sees the live connection and
+    clears it.
+
     The `stopped` flag prevents creation of new connections or dispatch after
     shutdown. Closing the pool terminates all active connections, closes the
     subscription, and stops the dispatch loop.
@@ -44,6 +66,7 @@ class ClientConnectionPool:
         if loop is None:
             loop = asyncio.get_event_loop()
 
+        self._loop = loop
         self._serializer = serializer
         self._spawner = spawner
         self._ssl_context = ssl_context
@@ -54,6 +77,8 @@ class ClientConnectionPool:
         self._addresses: dict[str, str] = {}
         self._connections: dict[str, ClientConnection] = {}
         self._handlers: dict[str, list[MessageHandler]] = defaultdict(list)
+        self._down_until: dict[str, float] = {}
+        self._down_backoffs: dict[str, ExponentialBackoff] = {}
 
         self._stopped = False
         self._lock = asyncio.Lock()
@@ -82,6 +107,8 @@ class ClientConnectionPool:
 
         self._connections.clear()
         self._addresses.clear()
+        self._down_until.clear()
+        self._down_backoffs.clear()
 
     async def get(self, node_id: str) -> ClientConnection:
         """
@@ -165,6 +192,7 @@ class ClientConnectionPool:
                 return
 
             self._addresses[node_id] = address
+            self._mark_up(node_id)
             conn = self._connections.pop(node_id, None)
             if conn is not None:
                 await conn.close()
@@ -174,13 +202,33 @@ class ClientConnectionPool:
         Send a message to the node identified by node_id.
 
         The connection is created lazily if needed. Sending is blocked once
-        the pool is stopped.
+        the pool is stopped, and fails fast with PeerUnavailableError while
+        the peer is marked down.
         """
         if self._stopped:
             raise RuntimeError("Connection pool is shut down")
 
+        down_until = self._down_until.get(node_id)
+        if down_until is not None:
+            conn = self._connections.get(node_id)
+            if conn is not None and conn.connected:
+                # reconnected through get() by another caller
+                self._mark_up(node_id)
+                down_until = None
+            elif self._loop.time() < down_until:
+                raise PeerUnavailableError(f"Node {node_id} is unavailable")
+
         conn = await self.get(node_id)
-        await conn.send(message)
+        try:
+            await conn.send(message)
+        except OSError:
+            # connection failures only (PeerConnectError, resets, ...);
+            # errors such as a bad message leave the peer state untouched
+            self._mark_down(node_id)
+            raise
+
+        if down_until is not None:
+            self._mark_up(node_id)
 
     def subscribe(self, msg_type: str, handler: MessageHandler) -> None:
         """
@@ -190,3 +238,16 @@ class ClientConnectionPool:
         of that type. Multiple handlers may be registered for the same type.
         """
         self._handlers[msg_type].append(handler)
+
+    def _mark_down(self, node_id: str) -> None:
+        backoff = self._down_backoffs.get(node_id)
+        if backoff is None:
+            backoff = self._down_backoffs[node_id] = self._backoff_factory()
+
+        delay = backoff.next_delay()
+        self._down_until[node_id] = self._loop.time() + delay
+        self._logger.warning(f"Node {node_id} marked down for {delay:.1f}s")
+
+    def _mark_up(self, node_id: str) -> None:
+        self._down_until.pop(node_id, None)
+        self._down_backoffs.pop(node_id, None)
@@ -37,6 +37,13 @@ class Membership:
     This structure is exchanged during gossip and used
     to maintain a consistent view of the ring.
     """
+
+    # Declared by hand rather than with slots=True so that `_tokens_cache`
+    # gets a slot without becoming a dataclass field.
+    __slots__ = (
+        "epoch", "incarnation", "node_id", "size", "phase", "tokens",
+        "peer_address", "_tokens_cache",
+    )
     epoch: int
     """
     A monotonically increasing version counter for the membership record.
@@ -108,6 +115,13 @@ class Membership:
 
     peer_address: str
 
+    def __post_init__(self) -> None:
+        # The encoded form of `tokens`, paired with a copy of the tokens it
+        # was built from. Gossip serializes every member on every round
+        # while tokens rarely change, so the 16-byte encoding is reused as
+        # long as the tokens compare equal.
+        self._tokens_cache: tuple[list[int], tuple[bytes, ...]] | None = None
+
     def is_newer_than(self, other: Membership) -> bool:
         if self.epoch > other.epoch:
             return True
@@ -124,13 +138,20 @@ class Membership:
         Tokens are stored as fixed‑width 16‑byte values to minimize overhead and
         ensure deterministic encoding across nodes.
         """
+        tokens = self.tokens
+        cache = self._tokens_cache
+        if cache is None or cache[0] != tokens:
+            cache = self._tokens_cache = (
+                list(tokens), tuple(self.tokens_bytes(tokens))
+            )
+
         return {
             "incarnation": self.incarnation,
             "epoch": self.epoch,
             "node_id": self.node_id,
             "size": self.size.name,
             "phase": self.phase.name,
-            "tokens": self.tokens_bytes(self.tokens),
+            "tokens": list(cache[1]),
             "peer_address": self.peer_address
         }
 
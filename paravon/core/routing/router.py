@@ -1,5 +1,6 @@
 import functools
 import logging
+import types
 from typing import Callable, Awaitable, Mapping, Any
 
 from paravon.core.models.message import Message
@@ -26,6 +27,7 @@ class Router:
 
     def __init__(self) -> None:
         self._routes: dict[str, RouteHandler] = {}
+        self._routes_view = types.MappingProxyType(self._routes)
         self._logger = logging.getLogger("core.routing.router")
 
     def request(self, method: str) -> Callable[[RouteHandler], RouteHandler]:
@@ -45,5 +47,6 @@ class Router:
     def resolve(self, method: str) -> RouteHandler | None:
         return self._routes.get(method)
 
-    def routes(self) -> dict[str, RouteHandler]:
-        return dict(self._routes)
+    def routes(self) -> Mapping[str, RouteHandler]:
+        """Return a read-only live view of the registered handlers."""
+        return self._routes_view
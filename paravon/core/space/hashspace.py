@@ -96,6 +96,12 @@ class HashSpace:
 
         Higher-level components decide whether these tokens represent vnodes,
         shards, or any other logical entity.
+
+        Produces the same values as `token(label, i)`; the "{label}-" prefix
+        is hashed once and its MD5 state copied for each index.
         """
+        prefix = hashlib.md5(f"{label}-".encode())
         for i in range(count):
-            yield cls.token(label, i)
+            h = prefix.copy()
+            h.update(b"%d" % i)
+            yield int.from_bytes(h.digest(), "big")
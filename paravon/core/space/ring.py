@@ -18,8 +18,8 @@ class Ring:
           return a new Ring instance rather than mutating the existing one.
         - VNode ordering is based solely on the token value. The node_id is
           carried as metadata but does not influence ordering or placement.
-        - Successor lookups use `bisect_right` with a key function that extracts
-          vnode.token, providing O(log n) lookup performance.
+        - Successor lookups use `bisect_right` over a parallel list of the
+          vnode tokens, providing O(log n) lookup performance.
         - The ring wraps around at the end of the token space, preserving the
           circular structure required by consistent hashing.
 
@@ -29,15 +29,18 @@ class Ring:
     def __init__(self, vnodes: list[VNode] = None, *, _sorted: bool = False) -> None:
         vnodes = vnodes or []
         self._vnodes = vnodes if _sorted else sorted(vnodes, key=lambda v: v.token)
+        # plain ints alongside the vnodes: the ring is immutable, so this is
+        # built once and lets lookups bisect without a per-step key call
+        self._tokens = [v.token for v in self._vnodes]
 
     def find_successor(self, token: int) -> VNode:
         """
         Return the vnode responsible for the given token.
 
-        The lookup uses `bisect_right` with a key function that extracts the
-        vnode's token. This allows us to search directly on the integer token
-        space, without constructing a synthetic VNode or relying on tuple
-        lexicographical ordering.
+        The lookup uses `bisect_right` on the token list kept alongside the
+        vnodes. This allows us to search directly on the integer token space,
+        without constructing a synthetic VNode, relying on tuple
+        lexicographical ordering, or calling a key function at every step.
 
         Because the vnode list is sorted by vnode.token, the bisect operation
         returns the index of the first vnode whose token is strictly greater
@@ -47,7 +50,7 @@ class Ring:
 
         Complexity: O(log n)
         """
-        idx = bisect.bisect_right(self._vnodes, token, key=lambda v: v.token)
+        idx = bisect.bisect_right(self._tokens, token)
         if idx == len(self._vnodes):
             idx = 0  # wrap-around
         return self._vnodes[idx]
@@ -89,7 +92,10 @@ class Ring:
         full traversal of the ring. This is used for successor walks,
         replication placement, and range scans.
         """
-        start = self._vnodes.index(vnode)
+        # vnodes are sorted by token, so the search can start where the
+        # token list says this vnode's token begins
+        lo = bisect.bisect_left(self._tokens, vnode.token)
+        start = self._vnodes.index(vnode, lo)
         for i in range(len(self._vnodes)):
             yield self._vnodes[(start + i) % len(self._vnodes)]
 
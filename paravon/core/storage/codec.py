@@ -12,37 +12,47 @@ class KeyCodec:
 
     @classmethod
     def decrement_key(cls, key: bytes) -> bytes:
-        for i in range(len(key) - 1, -1, -1):
-            if key[i] != 0x00:
-                return key[:i] + bytes([key[i] - 1]) + b"\xFF" * (len(key) - i - 1)
-        return b""
+        # rstrip scans in C for the last byte that can be decremented
+        head = key.rstrip(b"\x00")
+        if not head:
+            return b""
+        return b"".join((
+            head[:-1],
+            bytes((head[-1] - 1,)),
+            b"\xFF" * (len(key) - len(head)),
+        ))
 
     @classmethod
     def increment_key(cls, key: bytes) -> bytes:
-        for i in range(len(key) - 1, -1, -1):
-            if key[i] != 0xFF:
-                return key[:i] + bytes([key[i] + 1])
-        return key + b"\x00"
+        # rstrip scans in C for the last byte that can be incremented
+        head = key.rstrip(b"\xFF")
+        if not head:
+            return key + b"\x00"
+        return head[:-1] + bytes((head[-1] + 1,))
 
     @classmethod
     def data_prefix(cls, keyspace: bytes, user_key: bytes) -> bytes:
         user_len = len(user_key).to_bytes(cls.USER_LEN_SIZE, "big")
-        return keyspace + user_len + user_key
+        return b"".join((keyspace, user_len, user_key))
 
     @classmethod
     def index_prefix(cls, keyspace: bytes, hlc_bytes: bytes) -> bytes:
         hlc_len = cls.hlc_len(hlc_bytes)
-        return keyspace + hlc_len + hlc_bytes
+        return b"".join((keyspace, hlc_len, hlc_bytes))
 
+    # full keys are joined in one go rather than prefix + suffix so that
+    # each key costs a single allocation
     @classmethod
     def data_key(cls, keyspace: bytes, user_key: bytes, hlc_bytes: bytes) -> bytes:
+        user_len = len(user_key).to_bytes(cls.USER_LEN_SIZE, "big")
         hlc_len = cls.hlc_len(hlc_bytes)
-        return cls.data_prefix(keyspace, user_key) + hlc_len + hlc_bytes
+        return b"".join((keyspace, user_len, user_key, hlc_len, hlc_bytes))
 
     @classmethod
     def index_key(cls, keyspace: bytes, user_key: bytes, hlc_bytes: bytes) -> bytes:
         user_len = len(user_key).to_bytes(cls.USER_LEN_SIZE, "big")
-        return cls.index_prefix(keyspace, hlc_bytes) + user_len + user_key
+        hlc_len = cls.hlc_len(hlc_bytes)
+        return b"".join((keyspace, hlc_len, hlc_bytes, user_len, user_key))
 
     @classmethod
     def parse_data_key(
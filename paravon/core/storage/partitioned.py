@@ -14,7 +14,9 @@ class PartitionedStorage:
     ) -> None:
         self._storage_factory = storage_factory
         self._serializer = serializer
-        self._backends: dict[str, Storage] = {}
+        # keyspace -> backend; keyspaces are partition ids, so this stays
+        # bounded by the partition count
+        self._backends: dict[bytes, Storage] = {}
         self._lock = asyncio.Lock()
 
     async def get(self, keyspace: bytes, key: bytes) -> ValueVersion | None:
@@ -49,9 +51,15 @@ class PartitionedStorage:
             yield key, version
 
     async def close(self) -> None:
+        self._backends.clear()
         await self._storage_factory.close()
 
     async def _select_backend(self, keyspace: bytes) -> Storage:
-        pid = int(keyspace.decode("ascii"), 16)
+        if (backend := self._backends.get(keyspace)) is not None:
+            return backend
+
+        pid = int(keyspace, 16)
         env_index = pid // self._storage_factory.max_keyspaces
-        return await self._storage_factory.get(str(env_index))
+        backend = await self._storage_factory.get(str(env_index))
+        self._backends[keyspace] = backend
+        return backend
@@ -184,14 +184,26 @@ class VersionedStorageFactory:
         self._conflict_resolver = conflict_resolver
 
         self._versioned: dict[str, Storage] = {}
-        self._lock = asyncio.Lock()
+        # one lock per sid: opening a slow backend must not hold up the
+        # creation of unrelated storages
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._closed = False
 
     @property
     def max_keyspaces(self) -> int:
         return self._backend_factory.max_keyspaces
 
     async def get(self, sid: str) -> Storage:
-        async with self._lock:
+        if (storage := self._versioned.get(sid)) is not None:
+            return storage
+        if self._closed:
+            raise RuntimeError("Storage factory is closed")
+
+        lock = self._locks.setdefault(sid, asyncio.Lock())
+        async with lock:
+            # close() may have run while this call waited for the lock
+            if self._closed:
+                raise RuntimeError("Storage factory is closed")
             if sid not in self._versioned:
                 backend = await self._backend_factory.get(sid)
                 hlc = await self._get_hlc(backend)
@@ -204,10 +216,17 @@ class VersionedStorageFactory:
             return self._versioned[sid]
 
     async def close(self) -> None:
-        async with self._lock:
-            coros = [b.close() for b in self._versioned.values()]
-            await asyncio.gather(*coros, return_exceptions=True)
-            self._versioned.clear()
+        self._closed = True
+
+        # let in-flight creations finish so their storages get closed too
+        for lock in list(self._locks.values()):
+            async with lock:
+                pass
+
+        coros = [b.close() for b in self._versioned.values()]
+        await asyncio.gather(*coros, return_exceptions=True)
+        self._versioned.clear()
+        self._locks.clear()
 
     async def _get_hlc(self, backend: BackendStorage) -> HLC:
         hlc_bytes = await backend.get(
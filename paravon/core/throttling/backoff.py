@@ -53,11 +53,14 @@ class ExponentialBackoff:
         delay = self._current
 
         # Increase delay for next call
-        self._current = min(self._current * self.factor, self.maximum)
-
-        # Add jitter if enabled
-        if self.jitter > 0:
-            delay += random.uniform(0, self.jitter)
+        grown = delay * self.factor
+        maximum = self.maximum
+        self._current = grown if grown < maximum else maximum
+
+        # Add jitter if enabled; same distribution as uniform(0, jitter)
+        jitter = self.jitter
+        if jitter > 0:
+            delay += jitter * random.random()
 
         return delay
 
@@ -15,6 +15,8 @@ class FlowControl:
     - allow backpressure propagation to async producers
     """
 
+    __slots__ = ("_writable", "write_paused")
+
     def __init__(self) -> None:
         self._writable = asyncio.Event()
         self._writable.set()
@@ -22,6 +24,9 @@ class FlowControl:
 
     async def drain(self) -> None:
         """Block until writing is allowed again."""
+        if not self.write_paused:
+            # common case: no Event.wait() coroutine to create and run
+            return
         await self._writable.wait()
 
     def pause_writing(self) -> None:
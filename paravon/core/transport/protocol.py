@@ -11,6 +11,10 @@ from paravon.core.transport.flow import FlowControl
 from paravon.core.transport.stream import Streamer
 
 
+# "!I" = uint32 big-endian (network order), precompiled once per process
+_HDR = struct.Struct("!I")
+
+
 class Protocol(asyncio.Protocol):
     """
     Implements the low‑level framing and connection lifecycle for a
@@ -96,40 +100,53 @@ class Protocol(asyncio.Protocol):
         pass
 
     def data_received(self, data: bytes) -> None:
-        self._buffer.extend(data)
+        buffer = self._buffer
+        buffer.extend(data)
 
-        if len(self._buffer) > self._config.max_buffer_size:
+        max_size = self._config.max_buffer_size
+        if len(buffer) > max_size:
             self._logger.warning("Buffer overflow, closing connection")
             self._transport.close()
             return
 
-        while True:
-            if self._expected_length is None:
-                if len(self._buffer) < 4:
-                    return
+        # hot loop: bind everything it touches to locals once per call
+        unpack = _HDR.unpack_from
+        decode = self._decode_message
+        put = self._streamer.queue.put_nowait
+        expected = self._expected_length
 
-                # "!I" = uint32 big-endian (network order)
-                self._expected_length = struct.unpack("!I", self._buffer[:4])[0]
-                del self._buffer[:4]
+        # consumed bytes are tracked with an offset and dropped once on the
+        # way out, instead of shifting the buffer after every header/payload
+        offset = 0
+        try:
+            while True:
+                if expected is None:
+                    if len(buffer) - offset < 4:
+                        return
 
-                if self._expected_length > self._config.max_buffer_size:
-                    self._logger.warning("Message too large, closing connection")
-                    self._transport.close()
-                    return
+                    expected = unpack(buffer, offset)[0]
+                    offset += 4
 
-            if len(self._buffer) < self._expected_length:
-                return
+                    if expected > max_size:
+                        self._logger.warning("Message too large, closing connection")
+                        self._transport.close()
+                        return
 
-            payload = self._buffer[:self._expected_length]
-            del self._buffer[:self._expected_length]
-            self._expected_length = None
+                end = offset + expected
+                if len(buffer) < end:
+                    return
 
-            msg = self._decode_message(payload)
-            try:
-                self._streamer.queue.put_nowait(msg)
-            except Exception as exc:
-                self._logger.error(f"Queue error: {exc}")
-                continue
+                msg = decode(buffer[offset:end])
+                offset = end
+                expected = None
+
+                try:
+                    put(msg)
+                except Exception as exc:
+                    self._logger.error(f"Queue error: {exc}")
+        finally:
+            self._expected_length = expected
+            del buffer[:offset]
 
     def pause_writing(self) -> None:
         self._flow.pause_writing()
@@ -57,6 +57,12 @@ class LMDBStorage:
             self._write_pool, self._backend.put_many, items
         )
 
+    async def drop(self, keyspace: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._write_pool, self._backend.drop, keyspace
+        )
+
     async def iter(
         self,
         keyspace: bytes,
@@ -51,6 +51,12 @@ class LMDBBackend:
         with self._env.begin(db=dbi, write=True) as txn:
             return txn.delete(key)
 
+    def drop(self, db_name: bytes) -> None:
+        """Remove every key of the database, keeping the database itself."""
+        dbi = self._get_dbi(db_name)
+        with self._env.begin(write=True) as txn:
+            txn.drop(dbi, delete=False)
+
     def scan(
         self,
         db_name: bytes,
@@ -1,4 +1,5 @@
 import msgpack
+import threading
 from typing import Any
 
 from paravon.core.ports.serializer import Serializer
@@ -12,9 +13,20 @@ class MsgPackSerializer(Serializer):
     - compact
     - fast
     - widely used in distributed systems
+
+    A Packer is reused instead of letting packb() build one per call.
+    Packers keep an internal buffer and are not thread-safe, so each thread
+    lazily gets its own.
     """
+    def __init__(self) -> None:
+        self._local = threading.local()
+
     def serialize(self, message: Any) -> bytes:
-        return msgpack.packb(message, use_bin_type=True)
+        try:
+            packer = self._local.packer
+        except AttributeError:
+            packer = self._local.packer = msgpack.Packer(use_bin_type=True)
+        return packer.pack(message)
 
     def deserialize(self, data: bytes) -> Any:
         return msgpack.unpackb(data, raw=False)
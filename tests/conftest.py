@@ -8,16 +8,17 @@ from typing import Generator
 
 from paravon.core.cluster.table import BucketTable
 from paravon.core.models.membership import Membership, NodePhase, NodeSize
-from tests.fake.fake_transport import FakeTransport, JsonSerializer
+from tests.fake.fake_transport import FakeTransport
 from tests.helpers import FakeParaConfig
 from tests.utils import generate_cert_pair, write_pem
 
 from paravon.bootstrap.config.settings import ParavonConfig, TLSSettings
+from paravon.infra.msgpack_serializer import MsgPackSerializer
 
 
 @pytest.fixture
 def serializer():
-    return JsonSerializer()
+    return MsgPackSerializer()
 
 
 @pytest.fixture
@@ -26,8 +27,13 @@ def transport():
 
 
 @pytest.fixture(scope="session")
-def tls_settings(tmp_path_factory) -> tuple[TLSSettings, TLSSettings]:
-    ca_cert, server_key, server_cert, client_key, client_cert = generate_cert_pair()
+def cert_pair():
+    return generate_cert_pair()
+
+
+@pytest.fixture(scope="session")
+def tls_settings(tmp_path_factory, cert_pair) -> tuple[TLSSettings, TLSSettings]:
+    ca_cert, server_key, server_cert, client_key, client_cert = cert_pair
     base = tmp_path_factory.mktemp("mtls")
     ca_path = base / "ca.pem"
     server_cert_path = base / "server.pem"
@@ -1,12 +1,14 @@
+from collections import deque
+
 
 class FakeReceiveMessage:
     def __init__(self, messages):
-        self._messages = list(messages)
+        self._messages = deque(messages)
 
     async def __call__(self):
         if not self._messages:
             return None
-        return self._messages.pop(0)
+        return self._messages.popleft()
 
 
 class FakeSendMessage:
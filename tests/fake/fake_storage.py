@@ -10,39 +10,43 @@ class FakeBackendStorage(BackendStorage):
     """
 
     def __init__(self):
-        self._data = {}
+        self._data: dict[bytes, dict[bytes, bytes]] = {}
         self.get_calls = 0
 
     async def get(self, namespace: bytes, key: bytes) -> bytes | None:
         self.get_calls += 1
-        return self._data.get((namespace, key))
+        space = self._data.get(namespace)
+        return None if space is None else space.get(key)
 
     async def put(self, namespace: bytes, key: bytes, value: bytes) -> None:
-        self._data[(namespace, key)] = value
+        self._data.setdefault(namespace, {})[key] = value
 
     async def delete(self, namespace: bytes, key: bytes) -> None:
-        if (namespace, key) in self._data:
-            del self._data[(namespace, key)]
+        space = self._data.get(namespace)
+        if space is not None:
+            space.pop(key, None)
 
 
 class FakeStorageFactory:
+    __slots__ = ("_max_dbs", "_backends")
+
     def __init__(self, max_dbs: int = 10) -> None:
         self._max_dbs = max_dbs
         self._backends: dict[str, FakeBackendStorage] = {}
-        self._lock = asyncio.Lock()
 
     @property
     def max_keyspaces(self) -> int:
         return self._max_dbs
 
     async def get(self, sid: str) -> BackendStorage:
-        async with self._lock:
-            if sid not in self._backends:
-                self._backends[sid] = FakeBackendStorage()
-            return self._backends[sid]
+        # creation never awaits, so there is no window for a concurrent
+        # task to race us between the lookup and the insert
+        backend = self._backends.get(sid)
+        if backend is None:
+            backend = self._backends[sid] = FakeBackendStorage()
+        return backend
 
     async def close(self) -> None:
-        async with self._lock:
-            coros = [s.close() for s in self._backends.values()]
-            await asyncio.gather(*coros)
-            self._backends.clear()
+        coros = [s.close() for s in self._backends.values()]
+        await asyncio.gather(*coros)
+        self._backends.clear()
@@ -1,45 +1,4 @@
 import asyncio
-import json
-import base64
-from typing import Any
-
-from paravon.core.models.membership import Membership
-
-
-class FakeJSONEncoder(json.JSONEncoder):
-    """
-    JSON encoder that supports:
-    - bytes (encoded as base64)
-    - objects exposing to_dict()
-    """
-
-    def default(self, obj):
-        if isinstance(obj, bytes):
-            return {"__bytes__": base64.b64encode(obj).decode()}
-        return super().default(obj)
-
-
-class JsonSerializer:
-    @staticmethod
-    def hook_factory(classes: dict[str, type]):
-        def hook(obj):
-            if "__bytes__" in obj:
-                return base64.b64decode(obj["__bytes__"])
-
-            return obj
-
-        return hook
-
-    @staticmethod
-    def serialize(obj) -> bytes:
-        return json.dumps(obj, cls=FakeJSONEncoder).encode()
-
-    @classmethod
-    def deserialize(cls, data) -> Any:
-        return json.loads(
-            data.decode(),
-            object_hook=cls.hook_factory({"Membership": Membership}),
-        )
 
 
 class FakeTransport(asyncio.Transport):
@@ -49,11 +8,17 @@ class FakeTransport(asyncio.Transport):
 
     It records written data into an internal buffer and tracks whether the
     transport has been closed. It does not perform any real I/O.
+
+    Writes are appended as separate chunks and only joined when the buffer
+    is read, so a burst of writes costs one copy instead of one resize per
+    write.
     """
 
+    __slots__ = ("_chunks", "_closed", "_peername")
+
     def __init__(self) -> None:
         super().__init__()
-        self._buffer = bytearray()
+        self._chunks: list[bytes] = []
         self._closed = False
         self._peername = ("127.0.0.1", 9999)
 
@@ -65,9 +30,13 @@ class FakeTransport(asyncio.Transport):
     def write(self, data: bytes) -> None:
         if self._closed:
             raise RuntimeError("Cannot write to closed transport")
-        if not isinstance(data, (bytes, bytearray, memoryview)):
-            raise TypeError("data must be bytes-like")
-        self._buffer.extend(data)
+        if type(data) is not bytes:
+            # any buffer-protocol object is accepted, as by real transports
+            try:
+                data = memoryview(data).tobytes()
+            except TypeError:
+                raise TypeError("data must be bytes-like") from None
+        self._chunks.append(data)
 
     def close(self) -> None:
         self._closed = True
@@ -78,4 +47,8 @@ class FakeTransport(asyncio.Transport):
     # Optional helpers for tests
     @property
     def buffer(self) -> bytes:
-        return bytes(self._buffer)
+        chunks = self._chunks
+        if len(chunks) > 1:
+            # collapse once so later reads reuse the joined bytes
+            chunks[:] = [b"".join(chunks)]
+        return chunks[0] if chunks else b""
@@ -4,41 +4,56 @@ from paravon.core.storage.codec import KeyCodec
 from paravon.infra.lmdb_storage.backend import LMDBBackend
 
 
-def setup_backend(tmp_path):
-    backend = LMDBBackend(path=str(tmp_path), map_size=1 << 16)
+@pytest.fixture(scope="module")
+def shared_backend(tmp_path_factory):
+    # one LMDB environment per module; tests get an emptied keyspace
+    backend = LMDBBackend(
+        path=str(tmp_path_factory.mktemp("lmdb")), map_size=1 << 16, max_dbs=64
+    )
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def backend_ks(shared_backend):
     ks = b"a"
-    return backend, ks
+    yield shared_backend, ks
+    shared_backend.drop(ks)
+
+
+# shared by the forward/reverse parametrized cases; expected orderings are
+# computed once at collection time
+_ITEMS = [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")]
 
 
 def insert(backend, ks, items):
-    for k, v in items:
-        backend.put(ks, k, v)
+    # one write transaction for the whole fixture instead of one per item
+    backend.put_many([(ks, k, v) for k, v in items])
 
 
 @pytest.mark.it
-def test_basic_scan(tmp_path):
-    backend, ks = setup_backend(tmp_path)
-    items = [
-        (b"a", b"1"),
-        (b"c", b"3"),
-        (b"d", b"4"),
-    ]
-    insert(backend, ks, items)
-
-    out = backend.scan(ks)
-    assert out == items
+@pytest.mark.parametrize("reverse,expected", [
+    (False, _ITEMS),
+    (True, sorted(_ITEMS, reverse=True)),
+])
+def test_scan(backend_ks, reverse, expected):
+    backend, ks = backend_ks
+    insert(backend, ks, _ITEMS)
+
+    out = backend.scan(ks, reverse=reverse)
+    assert out == expected
 
 
 @pytest.mark.it
-def test_scan_empty_db(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_empty_db(backend_ks):
+    backend, ks = backend_ks
     out = backend.scan(ks)
     assert out == []
 
 
 @pytest.mark.it
-def test_scan_with_start(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_with_start(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"bar1", b"1"), (b"bar2", b"2"), (b"bar_a", b"3"),
         (b"foo1", b"1"), (b"foo2", b"2"), (b"foo_z", b"4"), (b"foo_a", b"3"),
@@ -64,45 +79,35 @@ def test_scan_with_start(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_with_start_empty_db(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_with_start_empty_db(backend_ks):
+    backend, ks = backend_ks
     out = backend.scan(ks, start=b"foo")
     assert out == []
 
 
 @pytest.mark.it
-def test_scan_start_after_all_forward(tmp_path):
-    backend, ks = setup_backend(tmp_path)
-    insert(backend, ks, [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")])
-
-    out = backend.scan(ks, start=b"z")
-    assert out == []
-
-
-@pytest.mark.it
-def test_scan_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
-    items = [
-        (b"a", b"1"),
-        (b"c", b"3"),
-        (b"d", b"4"),
-    ]
-    insert(backend, ks, items)
-
-    out = backend.scan(ks, reverse=True)
-    assert out == sorted(items, reverse=True)
+@pytest.mark.parametrize("reverse,expected", [
+    (False, []),
+    (True, sorted(_ITEMS, reverse=True)),
+])
+def test_scan_start_after_all(backend_ks, reverse, expected):
+    backend, ks = backend_ks
+    insert(backend, ks, _ITEMS)
+
+    out = backend.scan(ks, start=b"z", reverse=reverse)
+    assert out == expected
 
 
 @pytest.mark.it
-def test_scan_reverse_empty_db(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_reverse_empty_db(backend_ks):
+    backend, ks = backend_ks
     out = backend.scan(ks, reverse=True)
     assert out == []
 
 
 @pytest.mark.it
-def test_scan_with_start_and_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_with_start_and_reverse(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"bar1", b"1"), (b"bar2", b"2"), (b"bar_a", b"3"),
         (b"foo1", b"1"), (b"foo2", b"2"), (b"foo_z", b"4"), (b"foo_a", b"3"),
@@ -128,18 +133,8 @@ def test_scan_with_start_and_reverse(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_start_after_all_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
-    items = [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")]
-    insert(backend, ks, items)
-
-    out = backend.scan(ks, start=b"z", reverse=True)
-    assert out == sorted(items, reverse=True)
-
-
-@pytest.mark.it
-def test_scan_start_before_all_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_start_before_all_reverse(backend_ks):
+    backend, ks = backend_ks
     insert(backend, ks, [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")])
 
     out = backend.scan(ks, start=b"\x00", reverse=True)
@@ -147,8 +142,8 @@ def test_scan_start_before_all_reverse(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_start_between_forward(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_start_between_forward(backend_ks):
+    backend, ks = backend_ks
     items = [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")]
     insert(backend, ks, items)
 
@@ -157,8 +152,8 @@ def test_scan_start_between_forward(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_start_between_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_start_between_reverse(backend_ks):
+    backend, ks = backend_ks
     items = [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")]
     insert(backend, ks, items)
 
@@ -167,28 +162,21 @@ def test_scan_start_between_reverse(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_limit_forward(tmp_path):
-    backend, ks = setup_backend(tmp_path)
-    items = [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")]
-    insert(backend, ks, items)
-
-    out = backend.scan(ks, limit=2)
-    assert out == items[:2]
-
-
-@pytest.mark.it
-def test_scan_limit_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
-    items = [(b"a", b"1"), (b"c", b"3"), (b"d", b"4")]
-    insert(backend, ks, items)
-
-    out = backend.scan(ks, reverse=True, limit=2)
-    assert out == sorted(items, reverse=True)[:2]
+@pytest.mark.parametrize("reverse,expected", [
+    (False, _ITEMS[:2]),
+    (True, sorted(_ITEMS, reverse=True)[:2]),
+])
+def test_scan_limit(backend_ks, reverse, expected):
+    backend, ks = backend_ks
+    insert(backend, ks, _ITEMS)
+
+    out = backend.scan(ks, reverse=reverse, limit=2)
+    assert out == expected
 
 
 @pytest.mark.it
-def test_pagination_forward(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_pagination_forward(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"a", b"1"),
         (b"b", b"2"),
@@ -218,8 +206,8 @@ def test_pagination_forward(tmp_path):
 
 
 @pytest.mark.it
-def test_pagination_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_pagination_reverse(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"a", b"1"),
         (b"b", b"2"),
@@ -250,8 +238,8 @@ def test_pagination_reverse(tmp_path):
 
 
 @pytest.mark.it
-def test_get_latest_version(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_get_latest_version(backend_ks):
+    backend, ks = backend_ks
 
     items = [
         (b"a1", b"v1"),
@@ -268,8 +256,8 @@ def test_get_latest_version(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_basic(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_basic(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -288,8 +276,8 @@ def test_scan_prefix_basic(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_with_start_forward(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_with_start_forward(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -308,8 +296,8 @@ def test_scan_prefix_with_start_forward(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_with_start_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_with_start_reverse(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -328,8 +316,8 @@ def test_scan_prefix_with_start_reverse(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_limit(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_limit(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -342,8 +330,8 @@ def test_scan_prefix_limit(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_pagination_forward(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_pagination_forward(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -363,8 +351,8 @@ def test_scan_prefix_pagination_forward(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_pagination_reverse(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_pagination_reverse(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -386,8 +374,8 @@ def test_scan_prefix_pagination_reverse(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_not_found(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_not_found(backend_ks):
+    backend, ks = backend_ks
     insert(backend, ks, [(b"user:1", b"1"), (b"user:2", b"2")])
 
     out = backend.scan(ks, prefix=b"order:")
@@ -395,8 +383,8 @@ def test_scan_prefix_not_found(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_start_outside(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_start_outside(backend_ks):
+    backend, ks = backend_ks
     items = [(b"user:1", b"1"), (b"user:2", b"2")]
     insert(backend, ks, items)
 
@@ -405,8 +393,8 @@ def test_scan_prefix_start_outside(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_empty(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_empty(backend_ks):
+    backend, ks = backend_ks
     items = [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")]
     insert(backend, ks, items)
 
@@ -415,8 +403,8 @@ def test_scan_prefix_empty(tmp_path):
 
 
 @pytest.mark.it
-def test_scan_prefix_start_equals_prefix(tmp_path):
-    backend, ks = setup_backend(tmp_path)
+def test_scan_prefix_start_equals_prefix(backend_ks):
+    backend, ks = backend_ks
     items = [
         (b"user:1", b"1"),
         (b"user:2", b"2"),
@@ -428,3 +416,18 @@ def test_scan_prefix_start_equals_prefix(tmp_path):
     assert out == items
 
 
+@pytest.mark.it
+def test_drop_empties_only_the_named_db(tmp_path):
+    backend = LMDBBackend(path=str(tmp_path), map_size=1 << 16, max_dbs=4)
+    insert(backend, b"a", [(b"k1", b"1"), (b"k2", b"2")])
+    insert(backend, b"b", [(b"k1", b"1")])
+
+    backend.drop(b"a")
+
+    assert backend.scan(b"a") == []
+    assert backend.scan(b"b") == [(b"k1", b"1")]
+
+    # the database survives the drop and can be written again
+    backend.put(b"a", b"k3", b"3")
+    assert backend.get(b"a", b"k3") == b"3"
+    backend.close()
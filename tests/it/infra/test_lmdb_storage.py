@@ -1,10 +1,23 @@
+import asyncio
+
 import pytest
 from paravon.infra.lmdb_storage.aiobackend import LMDBStorage
 
 
+@pytest.fixture(scope="module")
+def shared_storage(tmp_path_factory):
+    # one LMDB environment per module; tests get emptied keyspaces
+    storage = LMDBStorage(
+        path=str(tmp_path_factory.mktemp("lmdb")), map_size=1 << 16, max_dbs=64
+    )
+    yield storage
+    asyncio.run(storage.close())
+
+
 @pytest.fixture
-def storage(tmp_path):
-    return LMDBStorage(path=str(tmp_path), map_size=1 << 16)
+def storage(shared_storage):
+    yield shared_storage
+    asyncio.run(shared_storage.drop(b"ks"))
 
 
 @pytest.mark.it
@@ -16,8 +29,6 @@ async def test_storage_basic_put_get_delete(storage):
     await storage.delete(b"ks", b"a")
     assert await storage.get(b"ks", b"a") is None
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
@@ -30,78 +41,66 @@ async def test_storage_put_many_and_iter_forward(storage):
     ]
     await storage.put_many(items)
 
-    out = []
-    async for k, v in storage.iter(b"ks"):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks")]
 
     assert out == [(b"a", b"1"), (b"b", b"2"), (b"c", b"3")]
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
 async def test_storage_iter_reverse(storage):
-    await storage.put(b"ks", b"a", b"1")
-    await storage.put(b"ks", b"b", b"2")
-    await storage.put(b"ks", b"c", b"3")
+    await asyncio.gather(
+        storage.put(b"ks", b"a", b"1"),
+        storage.put(b"ks", b"b", b"2"),
+        storage.put(b"ks", b"c", b"3"),
+    )
 
-    out = []
-    async for k, v in storage.iter(b"ks", reverse=True):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks", reverse=True)]
 
     assert out == [(b"c", b"3"), (b"b", b"2"), (b"a", b"1")]
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
 async def test_storage_iter_with_prefix(storage):
-    await storage.put(b"ks", b"user:1", b"1")
-    await storage.put(b"ks", b"user:2", b"2")
-    await storage.put(b"ks", b"order:1", b"10")
+    await asyncio.gather(
+        storage.put(b"ks", b"user:1", b"1"),
+        storage.put(b"ks", b"user:2", b"2"),
+        storage.put(b"ks", b"order:1", b"10"),
+    )
 
-    out = []
-    async for k, v in storage.iter(b"ks", prefix=b"user:"):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks", prefix=b"user:")]
 
     assert out == [(b"user:1", b"1"), (b"user:2", b"2")]
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
 async def test_storage_iter_prefix_and_start(storage):
-    await storage.put(b"ks", b"user:1", b"1")
-    await storage.put(b"ks", b"user:2", b"2")
-    await storage.put(b"ks", b"user:3", b"3")
+    await asyncio.gather(
+        storage.put(b"ks", b"user:1", b"1"),
+        storage.put(b"ks", b"user:2", b"2"),
+        storage.put(b"ks", b"user:3", b"3"),
+    )
 
-    out = []
-    async for k, v in storage.iter(b"ks", prefix=b"user:", start=b"user:2"):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks", prefix=b"user:", start=b"user:2")]
 
     assert out == [(b"user:2", b"2"), (b"user:3", b"3")]
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
 async def test_storage_iter_prefix_reverse_limit(storage):
-    await storage.put(b"ks", b"user:1", b"1")
-    await storage.put(b"ks", b"user:2", b"2")
-    await storage.put(b"ks", b"user:3", b"3")
+    await asyncio.gather(
+        storage.put(b"ks", b"user:1", b"1"),
+        storage.put(b"ks", b"user:2", b"2"),
+        storage.put(b"ks", b"user:3", b"3"),
+    )
 
-    out = []
-    async for k, v in storage.iter(b"ks", prefix=b"user:", reverse=True, limit=2):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks", prefix=b"user:", reverse=True, limit=2)]
 
     assert out == [(b"user:3", b"3"), (b"user:2", b"2")]
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
@@ -113,17 +112,12 @@ async def test_storage_iter_pagination_forward(storage):
         (b"d", b"4"),
         (b"e", b"5"),
     ]
-    for k, v in items:
-        await storage.put(b"ks", k, v)
+    await asyncio.gather(*(storage.put(b"ks", k, v) for k, v in items))
 
-    out = []
-    async for k, v in storage.iter(b"ks", batch_size=2):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks", batch_size=2)]
 
     assert out == items
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
@@ -135,23 +129,29 @@ async def test_storage_iter_pagination_reverse(storage):
         (b"d", b"4"),
         (b"e", b"5"),
     ]
-    for k, v in items:
-        await storage.put(b"ks", k, v)
+    await asyncio.gather(*(storage.put(b"ks", k, v) for k, v in items))
 
-    out = []
-    async for k, v in storage.iter(b"ks", batch_size=2, reverse=True):
-        out.append((k, v))
+    out = [(k, v) async for k, v in storage.iter(b"ks", batch_size=2, reverse=True)]
 
     assert out == list(reversed(items))
 
-    await storage.close()
-
 
 @pytest.mark.it
 @pytest.mark.asyncio
-async def test_storage_close(storage):
+async def test_storage_close(tmp_path):
+    storage = LMDBStorage(path=str(tmp_path), map_size=1 << 16)
     await storage.put(b"ks", b"a", b"1")
     await storage.close()
 
     with pytest.raises(Exception):
         await storage.put(b"ks", b"b", b"2")
+
+
+@pytest.mark.it
+@pytest.mark.asyncio
+async def test_storage_drop(storage):
+    await storage.put_many([(b"ks", b"a", b"1"), (b"ks", b"b", b"2")])
+
+    await storage.drop(b"ks")
+
+    assert [(k, v) async for k, v in storage.iter(b"ks")] == []
@@ -1,4 +1,5 @@
 import asyncio
+from typing import Generator
 
 import pytest
 
@@ -10,13 +11,38 @@ from paravon.infra.lmdb_storage.aiobackend import LMDBStorage
 from paravon.infra.msgpack_serializer import MsgPackSerializer
 
 
+# stateless, so one instance serves every test; HLCs stay per-test
+_SERIALIZER = MsgPackSerializer()
+# physical databases written by VersionedStorage, emptied after each test
+_SPACES = (
+    VersionedStorage.DATASPACE,
+    VersionedStorage.INDEXSPACE,
+    VersionedStorage.METASPACE,
+)
+
+
+@pytest.fixture(scope="module")
+def shared_backend(tmp_path_factory):
+    # one LMDB environment per module; tests get emptied keyspaces
+    backend = LMDBStorage(
+        str(tmp_path_factory.mktemp("lmdb")), map_size=1 << 20, max_dbs=64
+    )
+    yield backend
+    asyncio.run(backend.close())
+
+
 @pytest.fixture
-def vs(tmp_path) -> VersionedStorage:
-    backend = LMDBStorage(str(tmp_path), map_size=1 << 20)
-    serializer = MsgPackSerializer()
+def vs(shared_backend) -> Generator[VersionedStorage, None, None]:
+    backend = shared_backend
     hlc = HLC.initial(node_id="node-1")
     resolver = LWWConflictResolver()
-    return VersionedStorage(backend, hlc, serializer, resolver)
+    yield VersionedStorage(backend, hlc, _SERIALIZER, resolver)
+
+    async def drop_spaces() -> None:
+        for space in _SPACES:
+            await backend.drop(space)
+
+    asyncio.run(drop_spaces())
 
 
 @pytest.mark.it
@@ -72,9 +98,7 @@ async def test_vs_iter_temporal_order(vs):
     await asyncio.sleep(0.001)
     await vs.put(b"ks", b"c", b"3")
 
-    out = []
-    async for k, v in vs.iter(b"ks"):
-        out.append((k, v))
+    out = [(k, v) async for k, v in vs.iter(b"ks")]
 
     assert out == [
         (b"a", b"1"),
@@ -90,9 +114,7 @@ async def test_vs_iter_reverse(vs):
     await vs.put(b"ks", b"b", b"2")
     await vs.put(b"ks", b"c", b"3")
 
-    out = []
-    async for k, v in vs.iter(b"ks", reverse=True):
-        out.append((k, v))
+    out = [(k, v) async for k, v in vs.iter(b"ks", reverse=True)]
 
     assert out == [
         (b"c", b"3"),
@@ -108,10 +130,8 @@ async def test_vs_iter_prefix(vs):
     await vs.put(b"ks", b"user:2", b"2")
     await vs.put(b"ks", b"order:1", b"10")
 
-    out = []
     # bad usage because prefix and start is for internal usage
-    async for k, v in vs.iter(b"ks", prefix=b"user:"):
-        out.append((k, v))
+    out = [(k, v) async for k, v in vs.iter(b"ks", prefix=b"user:")]
 
     assert out == []
 
@@ -130,11 +150,10 @@ async def test_vs_multi_keyspace_isolation(vs):
 @pytest.mark.asyncio
 async def test_vs_hlc_persistence(tmp_path):
     backend = LMDBStorage(str(tmp_path), map_size=1 << 16)
-    serializer = MsgPackSerializer()
     resolver = LWWConflictResolver()
 
     vs1 = VersionedStorage(
-        backend, HLC.initial("node-1"), serializer, resolver
+        backend, HLC.initial("node-1"), _SERIALIZER, resolver
     )
     await vs1.put(b"ks", b"a", b"1")
     await vs1.close()
@@ -142,7 +161,7 @@ async def test_vs_hlc_persistence(tmp_path):
     # reopen
     backend2 = LMDBStorage(str(tmp_path), map_size=1 << 16)
     vs2 = VersionedStorage(
-        backend2, HLC.initial("node-1"), serializer, resolver
+        backend2, HLC.initial("node-1"), _SERIALIZER, resolver
     )
 
     await vs2.put(b"ks", b"a", b"2")
@@ -155,17 +174,15 @@ async def test_vs_hlc_persistence(tmp_path):
 
 @pytest.mark.it
 @pytest.mark.asyncio
-async def test_vs_iter_ignores_corrupted_index(vs):
+async def test_vs_iter_ignores_corrupted_index(vs, shared_backend):
     # normal entries
     await vs.put(b"ks", b"a", b"1")
     await vs.put(b"ks", b"b", b"2")
 
-    # inject corrupted index key
-    await vs._backend.put(VersionedStorage.INDEXSPACE, b"ksCORRUPTED", b"")
+    # inject corrupted index key through the backend vs writes to
+    await shared_backend.put(VersionedStorage.INDEXSPACE, b"ksCORRUPTED", b"")
 
-    out = []
-    async for k, v in vs.iter(b"ks"):
-        out.append((k, v))
+    out = [(k, v) async for k, v in vs.iter(b"ks")]
 
     assert out == [(b"a", b"1"), (b"b", b"2")]
 
@@ -181,8 +198,6 @@ async def test_vs_iter_since_hlc(vs):
 
     start = KeyCodec.index_prefix(b"ks", hlc_start)
 
-    out = []
-    async for k, v in vs.iter(b"ks", start=start):
-        out.append((k, v))
+    out = [(k, v) async for k, v in vs.iter(b"ks", start=start)]
 
     assert out == [(b"c", b"v3")]
@@ -1,8 +1,10 @@
 import pytest
 import zlib
 import json
+from unittest.mock import patch
 
 from paravon.core.cluster.bucket import Bucket
+from paravon.core.models.membership import NodePhase
 from tests.utils import make_member
 
 
@@ -50,12 +52,15 @@ def test_recompute_checksum_non_empty(bucket, serializer):
 
     bucket.recompute_checksum()
 
-    expected = 0
-    for m in sorted([m1, m2], key=lambda mi: mi.node_id):
-        raw = serializer.serialize(m.to_dict())
-        expected = zlib.crc32(raw, expected)
+    raws = [serializer.serialize(m.to_dict()) for m in (m1, m2)]
+    expected = zlib.crc32(b"".join(raws))
 
-    assert bucket.checksum == expected
+    # must stay wire-compatible with the chained per-member checksum
+    chained = 0
+    for raw in raws:
+        chained = zlib.crc32(raw, chained)
+
+    assert bucket.checksum == expected == chained
     assert bucket.dirty is False
 
 
@@ -88,6 +93,41 @@ def test_checksum_recomputed_when_dirty(bucket):
     assert bucket.dirty is False
 
 
+@pytest.mark.ut
+def test_checksum_reuses_unchanged_members(bucket, serializer):
+    m1 = make_member("a")
+    m2 = make_member("b", epoch=1)
+    bucket.add_or_update(m1)
+    bucket.add_or_update(m2)
+    bucket.get_checksum()
+
+    m2_next = make_member("b", epoch=2)
+    bucket.add_or_update(m2_next)
+
+    with patch.object(serializer, "serialize", wraps=serializer.serialize) as spy:
+        checksum = bucket.get_checksum()
+
+    spy.assert_called_once_with(m2_next.to_dict())
+    raws = [serializer.serialize(m.to_dict()) for m in (m1, m2_next)]
+    assert checksum == zlib.crc32(b"".join(raws))
+
+
+@pytest.mark.ut
+def test_remove_drops_member_from_checksum(bucket, serializer):
+    m1 = make_member("a")
+    m2 = make_member("b")
+    bucket.add_or_update(m1)
+    bucket.add_or_update(m2)
+    bucket.get_checksum()
+
+    assert bucket.remove("b") is m2
+    assert bucket.dirty is True
+    assert bucket.get_checksum() == zlib.crc32(serializer.serialize(m1.to_dict()))
+
+    assert bucket.remove("b") is None
+    assert bucket.dirty is False
+
+
 @pytest.mark.ut
 def test_checksum_deterministic_order(bucket, serializer):
     m1 = make_member("b")
@@ -126,3 +166,58 @@ def test_serialize_memberships(bucket):
 @pytest.mark.ut
 def test_serialize_memberships_empty(bucket):
     assert bucket.serialize_memberships() == {}
+
+
+@pytest.mark.ut
+def test_checksum_follows_in_place_updates(bucket, serializer):
+    m1 = make_member("a")
+    bucket.add_or_update(m1)
+    bucket.get_checksum()
+
+    # the local membership is mutated in place by the meta manager
+    m1.phase = NodePhase.idle
+    m2 = make_member("b")
+    bucket.add_or_update(m2)
+
+    raws = [serializer.serialize(m.to_dict()) for m in (m1, m2)]
+    assert bucket.get_checksum() == zlib.crc32(b"".join(raws))
+
+
+@pytest.mark.ut
+def test_checksum_follows_token_changes(bucket, serializer):
+    m = make_member("a", tokens=[1, 2])
+    bucket.add_or_update(m)
+    bucket.get_checksum()
+
+    for tokens in ([3, 4], [5, 6]):
+        m.tokens = tokens
+        bucket.dirty = True
+        assert bucket.get_checksum() == zlib.crc32(serializer.serialize(m.to_dict()))
+
+    m.tokens.append(7)
+    bucket.dirty = True
+    assert bucket.get_checksum() == zlib.crc32(serializer.serialize(m.to_dict()))
+
+
+@pytest.mark.ut
+def test_checksum_follows_direct_dict_writes(bucket, serializer):
+    m1 = make_member("a")
+    m2 = make_member("b")
+    bucket.add_or_update(m1)
+    bucket.get_checksum()
+
+    bucket.memberships["b"] = m2
+    bucket.dirty = True
+    raws = [serializer.serialize(m.to_dict()) for m in (m1, m2)]
+    assert bucket.get_checksum() == zlib.crc32(b"".join(raws))
+
+    # swap keys without changing the size
+    del bucket.memberships["a"]
+    bucket.memberships["c"] = make_member("c")
+    bucket.dirty = True
+    raws = [serializer.serialize(m.to_dict()) for m in bucket.memberships.values()]
+    assert bucket.get_checksum() == zlib.crc32(b"".join(raws))
+
+    bucket.memberships.pop("b")
+    bucket.dirty = True
+    assert bucket.get_checksum() == zlib.crc32(raws[1])
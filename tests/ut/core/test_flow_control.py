@@ -80,3 +80,15 @@ async def test_multiple_drains_unblocked_on_resume():
     await asyncio.gather(*tasks)
 
     assert results == [0, 1, 2]
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_drain_skips_event_when_not_paused(monkeypatch):
+    fc = FlowControl()
+
+    async def fail():
+        raise AssertionError("drain must not wait while writable")
+
+    monkeypatch.setattr(fc._writable, "wait", fail)
+    await fc.drain()
@@ -116,3 +116,9 @@ def test_generate_tokens_are_deterministic():
 def test_generate_tokens_are_unique():
     tokens = list(HashSpace.generate_tokens("node-1", 100))
     assert len(tokens) == len(set(tokens))
+
+
+@pytest.mark.ut
+def test_generate_tokens_match_token():
+    tokens = list(HashSpace.generate_tokens("node-1", 20))
+    assert tokens == [HashSpace.token("node-1", i) for i in range(20)]
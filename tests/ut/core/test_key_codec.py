@@ -0,0 +1,47 @@
+import pytest
+
+from paravon.core.storage.codec import KeyCodec
+
+
+@pytest.mark.ut
+@pytest.mark.parametrize("key, expected", [
+    (b"a", b"b"),
+    (b"ab", b"ac"),
+    (b"a\xff", b"b"),
+    (b"a\xff\xff", b"b"),
+    (b"\xff", b"\xff\x00"),
+    (b"\xff\xff", b"\xff\xff\x00"),
+    (b"", b"\x00"),
+])
+def test_increment_key(key, expected):
+    assert KeyCodec.increment_key(key) == expected
+
+
+@pytest.mark.ut
+@pytest.mark.parametrize("key, expected", [
+    (b"b", b"a"),
+    (b"ac", b"ab"),
+    (b"b\x00", b"a\xff"),
+    (b"b\x00\x00", b"a\xff\xff"),
+    (b"\x00", b""),
+    (b"\x00\x00", b""),
+    (b"", b""),
+])
+def test_decrement_key(key, expected):
+    assert KeyCodec.decrement_key(key) == expected
+
+
+@pytest.mark.ut
+def test_data_key_roundtrip():
+    key = KeyCodec.data_key(b"ks", b"user", b"hlc")
+    assert key == b"ks\x00\x04user\x00\x03hlc"
+    assert key.startswith(KeyCodec.data_prefix(b"ks", b"user"))
+    assert KeyCodec.parse_data_key(b"ks", key) == (b"hlc", b"user")
+
+
+@pytest.mark.ut
+def test_index_key_roundtrip():
+    key = KeyCodec.index_key(b"ks", b"user", b"hlc")
+    assert key == b"ks\x00\x03hlc\x00\x04user"
+    assert key.startswith(KeyCodec.index_prefix(b"ks", b"hlc"))
+    assert KeyCodec.parse_index_key(b"ks", key) == (b"hlc", b"user")
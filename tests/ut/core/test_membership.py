@@ -0,0 +1,56 @@
+import pytest
+from dataclasses import fields
+from unittest.mock import patch
+
+from paravon.core.models.membership import Membership
+from tests.utils import make_member
+
+
+@pytest.mark.ut
+def test_to_dict_roundtrip():
+    m = make_member("node-1", tokens=[1, 2**127])
+    assert Membership.from_dict(m.to_dict()) == m
+
+
+@pytest.mark.ut
+def test_to_dict_reuses_encoded_tokens():
+    m = make_member("node-1")
+
+    with patch.object(
+        Membership, "tokens_bytes", wraps=Membership.tokens_bytes
+    ) as spy:
+        first = m.to_dict()["tokens"]
+        first.append(b"\x00" * 16)
+        second = m.to_dict()["tokens"]
+
+    spy.assert_called_once()
+    assert second == Membership.tokens_bytes(m.tokens)
+
+
+@pytest.mark.ut
+def test_to_dict_follows_tokens_mutated_in_place():
+    m = make_member("node-1", tokens=[1])
+    m.to_dict()
+
+    m.tokens.append(2)
+
+    assert m.to_dict()["tokens"] == Membership.tokens_bytes([1, 2])
+
+
+@pytest.mark.ut
+def test_tokens_cache_is_not_a_field():
+    m = make_member("node-1")
+    m.to_dict()
+
+    assert "_tokens_cache" not in {f.name for f in fields(m)}
+    assert m == make_member("node-1")
+
+
+@pytest.mark.ut
+def test_to_dict_follows_replaced_tokens():
+    m = make_member("node-1", tokens=[1])
+    m.to_dict()
+
+    m.tokens = [2, 3]
+
+    assert m.to_dict()["tokens"] == Membership.tokens_bytes([2, 3])
@@ -39,7 +39,9 @@ def manager(peer_config, storage_factory, serializer):
 
 @pytest.mark.ut
 @pytest.mark.asyncio
-async def test_get_membership_initializes_from_config(manager, storage_factory):
+async def test_get_membership_initializes_from_config(
+    manager, storage_factory, serializer
+):
     membership = await manager.get_membership()
 
     assert membership.node_id == "node-1"
@@ -48,7 +50,7 @@ async def test_get_membership_initializes_from_config(manager, storage_factory):
     # node_id and phase must be persisted
     storage = await storage_factory.get(NodeMetaManager.SYS_SID)
     keyspace = NodeMetaManager.SYS_KEYSPACE
-    assert await storage.get(keyspace, b"node_id") == b'"node-1"'
+    assert await storage.get(keyspace, b"node_id") == serializer.serialize("node-1")
     assert await storage.get(keyspace, b"phase") is None
 
 
@@ -82,7 +84,11 @@ async def test_get_membership_raises_on_node_id_mismatch(
         peer_config, storage_factory, serializer
 ):
     storage = await storage_factory.get(NodeMetaManager.SYS_SID)
-    await storage.put(NodeMetaManager.SYS_KEYSPACE, b"node_id", b'"other-node"')
+    await storage.put(
+        NodeMetaManager.SYS_KEYSPACE,
+        b"node_id",
+        serializer.serialize("other-node")
+    )
 
     manager = NodeMetaManager(peer_config, storage_factory, serializer)
 
@@ -115,7 +121,7 @@ async def test_get_membership_uses_cache(manager, storage_factory):
 @pytest.mark.ut
 @pytest.mark.asyncio
 async def test_set_phase_initializes_membership_if_needed(
-        manager, storage_factory
+        manager, storage_factory, serializer
 ):
     storage = await storage_factory.get(NodeMetaManager.SYS_SID)
     await manager.set_phase(NodePhase.ready)
@@ -124,7 +130,7 @@ async def test_set_phase_initializes_membership_if_needed(
     assert membership.phase == NodePhase.ready
 
     stored = await storage.get(NodeMetaManager.SYS_KEYSPACE, b"phase")
-    assert stored == b'"ready"'
+    assert stored == serializer.serialize("ready")
 
 
 @pytest.mark.ut
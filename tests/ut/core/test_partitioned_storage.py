@@ -13,29 +13,29 @@ def make_version(value: bytes | None, node="A", tombstone=False):
 class DummyStorage:
     """Simple in‑memory backend returning ValueVersion objects."""
     def __init__(self):
-        self.data = {}
+        self.data: dict[bytes, dict[bytes, ValueVersion]] = {}
 
     async def get(self, keyspace, key):
-        return self.data.get((keyspace, key))
+        space = self.data.get(keyspace)
+        return None if space is None else space.get(key)
 
     async def put(self, keyspace, key, value):
         version = make_version(value)
-        self.data[(keyspace, key)] = version
+        self.data.setdefault(keyspace, {})[key] = version
         return version
 
     async def delete(self, keyspace, key):
         version = make_version(None, tombstone=True)
-        self.data[(keyspace, key)] = version
+        self.data.setdefault(keyspace, {})[key] = version
         return version
 
     async def apply(self, keyspace, key, version):
-        self.data[(keyspace, key)] = version
+        self.data.setdefault(keyspace, {})[key] = version
         return version
 
     async def iter(self, keyspace, hlc, batch_size=1024):
-        for (ks, key), version in self.data.items():
-            if ks == keyspace:
-                yield key, version
+        for key, version in self.data.get(keyspace, {}).items():
+            yield key, version
 
     async def close(self):
         pass
@@ -114,5 +114,15 @@ async def test_two_keyspaces_two_envs(storage):
     backend2 = await storage._select_backend(b"0008")
 
     assert backend1 is not backend2
-    assert backend1.data[(b"0001", b"a")].value == b"1"
-    assert backend2.data[(b"0008", b"a")].value == b"2"
+    assert backend1.data[b"0001"][b"a"].value == b"1"
+    assert backend2.data[b"0008"][b"a"].value == b"2"
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_select_backend_caches_route(storage):
+    backend = await storage._select_backend(b"0001")
+    storage._storage_factory.envs.clear()
+
+    assert await storage._select_backend(b"0001") is backend
+    assert storage._storage_factory.envs == {}
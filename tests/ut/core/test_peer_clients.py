@@ -3,12 +3,21 @@ import struct
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
-from paravon.core.connections.client import ClientConnection
-from paravon.core.connections.pool import ClientConnectionPool
+from paravon.core.connections.client import ClientConnection, PeerConnectError
+from paravon.core.connections.pool import ClientConnectionPool, PeerUnavailableError
 from paravon.core.helpers.sub import Subscription
 from paravon.core.helpers.spawn import TaskSpawner
 from paravon.core.throttling.backoff import ExponentialBackoff
 from paravon.core.models.message import Message
+from paravon.infra.msgpack_serializer import MsgPackSerializer
+
+
+_HDR = struct.Struct("!I")
+
+
+# built once with the same serializer as the `serializer` fixture
+_ECHO_PAYLOAD = MsgPackSerializer().serialize({"type": "t", "data": {"num": 123}})
+_ECHO_FRAME = _HDR.pack(len(_ECHO_PAYLOAD)) + _ECHO_PAYLOAD
 
 
 @pytest.fixture
@@ -96,7 +105,7 @@ async def test_send_connects_implicitly(para_config, serializer, backoff):
     with patch("asyncio.open_connection", return_value=(reader, writer)):
         await client.send(Message(type="t", data={"num": 1}))
 
-    writer.write.assert_called_once()
+    writer.writelines.assert_called_once()
 
 
 @pytest.mark.ut
@@ -113,7 +122,7 @@ async def test_send_raises_if_connect_fails(para_config, serializer, backoff):
     )
 
     with patch("asyncio.open_connection", side_effect=Exception("fail")):
-        with pytest.raises(RuntimeError):
+        with pytest.raises(PeerConnectError):
             await client.send(Message(type="t", data={"num": 1}))
 
 
@@ -157,12 +166,8 @@ async def test_recv_publishes_message(para_config, serializer, backoff):
         max_retries=3,
     )
 
-    msg = {"type": "t", "data": {"num": 123}}
-    payload = serializer.serialize(msg)
-    frame = struct.pack("!I", len(payload)) + payload
-
     async def feed():
-        reader.feed_data(frame)
+        reader.feed_data(_ECHO_FRAME)
         await asyncio.sleep(0)
         reader.feed_eof()
 
@@ -231,7 +236,7 @@ async def test_recv_deserialize_none_stops(para_config, backoff, serializer):
     writer = MagicMock()
 
     payload = serializer.serialize({"type": "t", "data": {"num": "ABC"}})
-    frame = struct.pack("!I", len(payload)) + payload
+    frame = _HDR.pack(len(payload)) + payload
 
     async def feed():
         reader.feed_data(frame)
@@ -416,6 +421,117 @@ async def test_send_raises_if_stopped(serializer, para_config):
         await pool.send("n1", Message(type="t", data={}))
 
 
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_send_fails_fast_when_peer_down(serializer, para_config):
+    pool = ClientConnectionPool(
+        serializer=serializer,
+        spawner=TaskSpawner(asyncio.get_event_loop()),
+        ssl_context=para_config.get_client_ssl_ctx(),
+        backoff_factory=lambda: ExponentialBackoff(initial=60.0, jitter=0),
+        max_retries=3,
+        loop=asyncio.get_event_loop(),
+    )
+    await pool.register("n1", "127.0.0.1:9000")
+
+    fake_conn = AsyncMock()
+    fake_conn.connected = False
+    fake_conn.send.side_effect = PeerConnectError("Unable to connect")
+    pool._connections["n1"] = fake_conn
+
+    msg = Message(type="t", data={})
+    with pytest.raises(PeerConnectError):
+        await pool.send("n1", msg)
+
+    with pytest.raises(PeerUnavailableError):
+        await pool.send("n1", msg)
+
+    fake_conn.send.assert_called_once_with(msg)
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_send_recovers_after_down_window(serializer, para_config):
+    pool = ClientConnectionPool(
+        serializer=serializer,
+        spawner=TaskSpawner(asyncio.get_event_loop()),
+        ssl_context=para_config.get_client_ssl_ctx(),
+        backoff_factory=lambda: ExponentialBackoff(initial=0.0, jitter=0),
+        max_retries=3,
+        loop=asyncio.get_event_loop(),
+    )
+    await pool.register("n1", "127.0.0.1:9000")
+
+    fake_conn = AsyncMock()
+    fake_conn.connected = False
+    fake_conn.send.side_effect = [PeerConnectError("Unable to connect"), None]
+    pool._connections["n1"] = fake_conn
+
+    msg = Message(type="t", data={})
+    with pytest.raises(PeerConnectError):
+        await pool.send("n1", msg)
+
+    await pool.send("n1", msg)
+    assert pool._down_until == {}
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_send_clears_down_state_after_reconnect(serializer, para_config):
+    pool = ClientConnectionPool(
+        serializer=serializer,
+        spawner=TaskSpawner(asyncio.get_event_loop()),
+        ssl_context=para_config.get_client_ssl_ctx(),
+        backoff_factory=lambda: ExponentialBackoff(initial=60.0, jitter=0),
+        max_retries=3,
+        loop=asyncio.get_event_loop(),
+    )
+    await pool.register("n1", "127.0.0.1:9000")
+
+    fake_conn = AsyncMock()
+    fake_conn.connected = False
+    fake_conn.send.side_effect = [PeerConnectError("Unable to connect"), None]
+    pool._connections["n1"] = fake_conn
+
+    msg = Message(type="t", data={})
+    with pytest.raises(PeerConnectError):
+        await pool.send("n1", msg)
+    with pytest.raises(ConnectionError):
+        await pool.send("n1", msg)
+
+    # e.g. the prober reconnected through pool.get() + client.send()
+    fake_conn.connected = True
+
+    await pool.send("n1", msg)
+    assert pool._down_until == {}
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_send_serialization_error_keeps_peer_up(serializer, para_config):
+    pool = ClientConnectionPool(
+        serializer=serializer,
+        spawner=TaskSpawner(asyncio.get_event_loop()),
+        ssl_context=para_config.get_client_ssl_ctx(),
+        backoff_factory=lambda: ExponentialBackoff(initial=60.0, jitter=0),
+        max_retries=3,
+        loop=asyncio.get_event_loop(),
+    )
+    await pool.register("n1", "127.0.0.1:9000")
+
+    fake_conn = AsyncMock()
+    fake_conn.send.side_effect = [TypeError("can not serialize"), None]
+    pool._connections["n1"] = fake_conn
+
+    msg = Message(type="t", data={})
+    with pytest.raises(TypeError):
+        await pool.send("n1", msg)
+
+    assert pool._down_until == {}
+    await pool.send("n1", msg)
+    assert fake_conn.send.await_count == 2
+
+
 @pytest.mark.ut
 @pytest.mark.asyncio
 async def test_dispatch_calls_handlers(serializer, para_config):
@@ -96,6 +96,28 @@ def test_iter_from_wraps_around():
     assert order == ["B", "C", "A"]
 
 
+@pytest.mark.ut
+def test_iter_from_with_shared_token():
+    vnodes = [
+        VNode(node_id="A", token=100),
+        VNode(node_id="B", token=200),
+        VNode(node_id="C", token=200),
+    ]
+    ring = Ring(vnodes)
+
+    order = [v.node_id for v in ring.iter_from(VNode(node_id="C", token=200))]
+
+    assert order == ["C", "A", "B"]
+
+
+@pytest.mark.ut
+def test_iter_from_unknown_vnode_raises():
+    ring = Ring([VNode(node_id="A", token=100)])
+
+    with pytest.raises(ValueError):
+        list(ring.iter_from(VNode(node_id="B", token=100)))
+
+
 @pytest.mark.ut
 def test_len_and_getitem():
     vnodes = [
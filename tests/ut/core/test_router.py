@@ -36,7 +36,7 @@ def test_router_duplicate_registration():
 
 
 @pytest.mark.ut
-def test_router_routes_returns_copy():
+def test_router_routes_returns_readonly_view():
     router = Router()
 
     @router.request("ping")
@@ -46,3 +46,7 @@ def test_router_routes_returns_copy():
     routes = router.routes()
     assert "ping" in routes
     assert routes is not router._routes
+    assert dict(routes) == router._routes
+
+    with pytest.raises(TypeError):
+        routes["pong"] = h  # type: ignore[index]
@@ -227,3 +227,28 @@ async def test_transport_waits_for_full_frame(monkeypatch, serializer, transport
     assert proto._buffer == b"he"
     assert proto._expected_length == 5
     serializer.deserialize.assert_not_called()
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_data_received_burst_keeps_only_partial_tail(config, server_state, serializer, transport):
+    proto = Protocol(config, server_state, serializer)
+    proto.connection_made(transport)
+
+    proto._streamer.queue = Mock()
+    proto._streamer.queue.put_nowait = Mock()
+
+    payload = serializer.serialize({"type": "ping", "data": {}})
+    frame = struct.pack("!I", len(payload)) + payload
+
+    proto.data_received(frame * 3 + frame[:6])
+
+    assert proto._streamer.queue.put_nowait.call_count == 3
+    assert proto._buffer == frame[4:6]
+    assert proto._expected_length == len(payload)
+
+    proto.data_received(frame[6:])
+
+    assert proto._streamer.queue.put_nowait.call_count == 4
+    assert proto._buffer == b""
+    assert proto._expected_length is None
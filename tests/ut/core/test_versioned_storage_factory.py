@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from paravon.core.storage.versioned import VersionedStorageFactory
+from paravon.core.helpers.lww import LWWConflictResolver
+from tests.fake.fake_storage import FakeStorageFactory
+
+
+class SlowStorageFactory(FakeStorageFactory):
+    """Backend factory whose first open of a given sid can be held open."""
+    def __init__(self) -> None:
+        super().__init__()
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def get(self, sid: str):
+        if gate := self.gates.get(sid):
+            await gate.wait()
+        return await super().get(sid)
+
+
+@pytest.fixture
+def backend_factory():
+    return SlowStorageFactory()
+
+
+@pytest.fixture
+def factory(backend_factory, serializer):
+    return VersionedStorageFactory(
+        backend_factory=backend_factory,
+        serializer=serializer,
+        conflict_resolver=LWWConflictResolver(),
+        node_id="node-1",
+    )
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_factory_concurrent_get_same_sid_returns_one_storage(factory):
+    a, b = await asyncio.gather(factory.get("0"), factory.get("0"))
+    assert a is b
+    assert await factory.get("0") is a
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_factory_slow_sid_does_not_block_other_sids(factory, backend_factory):
+    gate = backend_factory.gates["slow"] = asyncio.Event()
+    slow = asyncio.create_task(factory.get("slow"))
+    await asyncio.sleep(0)
+
+    fast = await asyncio.wait_for(factory.get("fast"), timeout=1)
+    assert fast is not None
+    assert not slow.done()
+
+    gate.set()
+    assert await slow is await factory.get("slow")
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_factory_get_after_close_raises(factory):
+    await factory.get("0")
+    await factory.close()
+
+    with pytest.raises(RuntimeError):
+        await factory.get("0")
+
+
+@pytest.mark.ut
+@pytest.mark.asyncio
+async def test_factory_get_during_close_raises(factory, backend_factory):
+    gate = backend_factory.gates["0"] = asyncio.Event()
+    first = asyncio.create_task(factory.get("0"))
+    await asyncio.sleep(0)
+
+    # close() now waits on the in-flight creation of "0"; a storage for a
+    # new sid created from here on would never be closed
+    closing = asyncio.create_task(factory.close())
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError):
+        await factory.get("1")
+
+    gate.set()
+    await first
+    await closing
@@ -30,7 +30,7 @@ def test_next_delay_with_jitter():
     b = ExponentialBackoff(initial=1.0, factor=2.0, maximum=10.0, jitter=1.0)
 
     d = b.next_delay()
-    # delay = current + random.uniform(0, jitter)
+    # delay = current + jitter * random.random()
     assert 1.0 <= d <= 2.0
     assert b._current == 2.0
 
@@ -4,15 +4,57 @@ from pathlib import Path
 
 from cryptography import x509
 from cryptography.x509.oid import NameOID
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
 
 from paravon.core.models.membership import Membership, NodePhase, NodeSize
 
 
-def generate_cert_pair():
+_CA_BC = x509.BasicConstraints(ca=True, path_length=None)
+_CA_KU = x509.KeyUsage(
+    digital_signature=False,
+    content_commitment=False,
+    key_encipherment=False,
+    data_encipherment=False,
+    key_agreement=False,
+    key_cert_sign=True,   # indispensable pour un CA
+    crl_sign=True,        # indispensable pour un CA
+    encipher_only=False,
+    decipher_only=False,
+)
+_LEAF_SAN = x509.SubjectAlternativeName([
+    x509.IPAddress(ipaddress.IPv4Address("127.0.0.1"))
+])
+_LEAF_KU = x509.KeyUsage(
+    digital_signature=True,
+    content_commitment=False,
+    key_encipherment=False,
+    data_encipherment=False,
+    key_agreement=False,
+    key_cert_sign=False,
+    crl_sign=False,
+    encipher_only=False,
+    decipher_only=False,
+)
+
+_CA_CACHE = None
+
+
+def _get_ca():
+    """
+    Build the test CA once and reuse it: only the leaf keys need to be
+    fresh for each pair.
+    """
+    global _CA_CACHE
+    if _CA_CACHE is not None:
+        return _CA_CACHE
+
+    now = datetime.now(tz=UTC)
+    not_before = now - timedelta(days=1)
+    not_after = now + timedelta(days=1)
+
     # Generate CA key
-    ca_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ca_key = ed25519.Ed25519PrivateKey.generate()
 
     # Build CA certificate with SKI + KeyUsage
     subject = issuer = x509.Name([
@@ -25,39 +67,33 @@ def generate_cert_pair():
         .issuer_name(issuer)
         .public_key(ca_key.public_key())
         .serial_number(x509.random_serial_number())
-        .not_valid_before(datetime.now(tz=UTC) - timedelta(days=1))
-        .not_valid_after(datetime.now(tz=UTC) + timedelta(days=1))
-        .add_extension(
-            x509.BasicConstraints(ca=True, path_length=None),
-            critical=True,
-        )
-        .add_extension(
-            x509.KeyUsage(
-                digital_signature=False,
-                content_commitment=False,
-                key_encipherment=False,
-                data_encipherment=False,
-                key_agreement=False,
-                key_cert_sign=True,   # indispensable pour un CA
-                crl_sign=True,        # indispensable pour un CA
-                encipher_only=False,
-                decipher_only=False,
-            ),
-            critical=True,
-        )
+        .not_valid_before(not_before)
+        .not_valid_after(not_after)
+        .add_extension(_CA_BC, critical=True)
+        .add_extension(_CA_KU, critical=True)
         .add_extension(
             x509.SubjectKeyIdentifier.from_public_key(ca_key.public_key()),
             critical=False,
         )
     )
 
-    ca_cert = ca_cert_builder.sign(ca_key, hashes.SHA256())
+    ca_cert = ca_cert_builder.sign(ca_key, None)
 
     # Extract SKI for AKI
     ski = ca_cert.extensions.get_extension_for_class(x509.SubjectKeyIdentifier).value
 
+    _CA_CACHE = ca_key, ca_cert, ski
+    return _CA_CACHE
+
+
+def generate_cert_pair():
+    ca_key, ca_cert, ski = _get_ca()
+    now = datetime.now(tz=UTC)
+    not_before = now - timedelta(days=1)
+    not_after = now + timedelta(days=1)
+
     def generate_cert(common_name):
-        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        key = ed25519.Ed25519PrivateKey.generate()
         subject = x509.Name([
             x509.NameAttribute(NameOID.COMMON_NAME, common_name),
         ])
@@ -68,8 +104,8 @@ def generate_cert_pair():
             .issuer_name(ca_cert.subject)
             .public_key(key.public_key())
             .serial_number(x509.random_serial_number())
-            .not_valid_before(datetime.now(tz=UTC) - timedelta(days=1))
-            .not_valid_after(datetime.now(tz=UTC) + timedelta(days=1))
+            .not_valid_before(not_before)
+            .not_valid_after(not_after)
             .add_extension(
                 x509.AuthorityKeyIdentifier.from_issuer_subject_key_identifier(ski),
                 critical=False,
@@ -78,29 +114,11 @@ def generate_cert_pair():
                 x509.SubjectKeyIdentifier.from_public_key(key.public_key()),
                 critical=False,
             )
-            .add_extension(
-                x509.SubjectAlternativeName([
-                    x509.IPAddress(ipaddress.IPv4Address("127.0.0.1"))
-                ]),
-                critical=False,
-            )
-            .add_extension(
-                x509.KeyUsage(
-                    digital_signature=True,
-                    content_commitment=False,
-                    key_encipherment=True,
-                    data_encipherment=False,
-                    key_agreement=False,
-                    key_cert_sign=False,
-                    crl_sign=False,
-                    encipher_only=False,
-                    decipher_only=False,
-                ),
-                critical=True,
-            )
+            .add_extension(_LEAF_SAN, critical=False)
+            .add_extension(_LEAF_KU, critical=True)
         )
 
-        cert = cert_builder.sign(ca_key, hashes.SHA256())
+        cert = cert_builder.sign(ca_key, None)
         return key, cert
 
     server_key, server_cert = generate_cert("server.test")
@@ -115,18 +133,23 @@ def write_pem(obj, path: Path) -> None:
     else:
         data = obj.private_bytes(
             serialization.Encoding.PEM,
-            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.PrivateFormat.PKCS8,
             serialization.NoEncryption(),
         )
     path.write_bytes(data)
 
 
+# immutable template; every member gets its own list since tokens may be
+# mutated in place
+_DEFAULT_TOKENS = (1, 2, 3, 4, 5, 6, 7, 8)
+
+
 def make_member(node_id, tokens=None, epoch=1, incarnation=1):
     return Membership(
         epoch=epoch,
         incarnation=incarnation,
         node_id=node_id,
-        tokens=tokens or [1, 2, 3, 4, 5, 6, 7, 8],
+        tokens=tokens or list(_DEFAULT_TOKENS),
         phase=NodePhase.ready,
         size=NodeSize.L,
         peer_address="1.2.3.4:6000"